@@ -1,16 +1,11 @@
 from __future__ import with_statement
 
-import os
 from logging.config import fileConfig
 
 from sqlalchemy import engine_from_config
 from sqlalchemy import pool
 from alembic import context
 
-from dotenv import load_dotenv
-
-load_dotenv()
-
 config = context.config
 
 if config.config_file_name is not None:
@@ -21,13 +16,11 @@ from app.db.base import Base  # noqa
 
 # Register models
 import app.models  # noqa
+from app.settings import get_settings  # noqa
 
 
 def get_url():
-    url = os.getenv("DATABASE_URL")
-    if not url:
-        raise RuntimeError("DATABASE_URL not set. Create backend/.env and set DATABASE_URL.")
-    return url
+    return get_settings().require_database_url()
 
 
 target_metadata = Base.metadata
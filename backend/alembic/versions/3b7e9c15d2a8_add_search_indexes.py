@@ -0,0 +1,26 @@
+from alembic import op
+
+revision = "3b7e9c15d2a8"
+down_revision = "8a41d6e0c2f7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Expressions must match app/crud/search.py exactly for the planner to use them
+    op.execute("CREATE INDEX IF NOT EXISTS ix_notes_body_fts ON notes USING gin (to_tsvector('english', body))")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_transactions_explanation_fts "
+        "ON transactions USING gin (to_tsvector('english', coalesce(explanation, '')))"
+    )
+    op.execute("CREATE INDEX IF NOT EXISTS ix_transactions_merchant_trgm ON transactions USING gin (merchant gin_trgm_ops)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_transactions_user_name_trgm ON transactions USING gin (user_name gin_trgm_ops)")
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_transactions_user_name_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_transactions_merchant_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_transactions_explanation_fts")
+    op.execute("DROP INDEX IF EXISTS ix_notes_body_fts")
@@ -0,0 +1,53 @@
+from alembic import op
+import sqlalchemy as sa
+
+revision = "5f3c2a91b7e4"
+down_revision = "d0a9f98e0864"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("cases", sa.Column("sla_due_at", sa.DateTime(timezone=True), nullable=True))
+    op.add_column("cases", sa.Column("version", sa.Integer(), nullable=False, server_default="1"))
+
+    op.add_column("cases", sa.Column("priority", sa.String(length=20), nullable=True))
+    op.add_column(
+        "cases",
+        sa.Column(
+            "severity_rank",
+            sa.Integer(),
+            sa.Computed(
+                "CASE severity WHEN 'RED' THEN 0 WHEN 'ORANGE' THEN 1 WHEN 'GREEN' THEN 2 ELSE 3 END",
+                persisted=True,
+            ),
+        ),
+    )
+
+    # Existing open cases get the per-severity SLA (app.crud.cases.SLA_MINUTES) from their creation time
+    op.execute(
+        """
+        UPDATE cases
+        SET sla_due_at = created_at + CASE severity
+            WHEN 'RED' THEN interval '1 hour'
+            WHEN 'GREEN' THEN interval '4 hours'
+            ELSE interval '2 hours'
+        END
+        WHERE sla_due_at IS NULL AND status <> 'CLOSED'
+        """
+    )
+
+    op.create_index(
+        "ix_cases_queue",
+        "cases",
+        ["severity_rank", "sla_due_at", "id"],
+        postgresql_where=sa.text("assigned_to IS NULL AND status IN ('NEW', 'OPEN')"),
+    )
+
+
+def downgrade():
+    op.drop_index("ix_cases_queue", table_name="cases")
+    op.drop_column("cases", "severity_rank")
+    op.drop_column("cases", "priority")
+    op.drop_column("cases", "version")
+    op.drop_column("cases", "sla_due_at")
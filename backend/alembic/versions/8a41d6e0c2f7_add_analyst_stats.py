@@ -0,0 +1,35 @@
+from alembic import op
+import sqlalchemy as sa
+
+revision = "8a41d6e0c2f7"
+down_revision = "5f3c2a91b7e4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "analyst_stats",
+        sa.Column("analyst", sa.String(length=255), primary_key=True),
+        sa.Column("total_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("open_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("closed_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("escalated_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("sla_due_sum", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("sla_due_n", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+    )
+
+    op.create_table(
+        "analyst_sla_buckets",
+        sa.Column("analyst", sa.String(length=255), primary_key=True),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), primary_key=True),
+        sa.Column("open_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+    # Counters start empty; the app's reconciliation pass fills them from cases on boot.
+
+
+def downgrade():
+    op.drop_table("analyst_sla_buckets")
+    op.drop_table("analyst_stats")
@@ -4,7 +4,7 @@ from alembic import op
 # - Keep "revision" as whatever Alembic generated for you.
 # - Only set down_revision exactly to the current head below.
 
-revision = "<KEEP_YOURS_FROM_GENERATED_FILE>"
+revision = "d0a9f98e0864"
 down_revision = "26be9f628187"
 branch_labels = None
 depends_on = None
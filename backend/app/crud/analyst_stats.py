@@ -0,0 +1,226 @@
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
+
+from sqlalchemy.orm import Session
+from sqlalchemy import select, delete, update, insert, func, case, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from app.models.case import Case
+from app.models.analyst_stats import AnalystStats, AnalystSlaBucket
+
+
+# Bucket key for cases nobody has claimed yet
+UNASSIGNED = "__unassigned__"
+
+DUE_SOON_MINUTES = 30
+
+# pg advisory lock key so only one worker rebuilds the stats at a time
+RECONCILE_LOCK_KEY = 0x67705F7374617473  # "gp_stats"
+
+# (assigned_to, status, sla_due_at) -- the only case fields the stats depend on
+CaseSnapshot = Tuple[Optional[str], str, Optional[datetime]]
+
+
+def case_snapshot(obj: Case) -> CaseSnapshot:
+    return (obj.assigned_to, obj.status, obj.sla_due_at)
+
+
+def _as_utc(dt: datetime) -> datetime:
+    # SQLite hands datetimes back naive; everything we write is UTC
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def _bucket(dt: datetime) -> datetime:
+    return _as_utc(dt).replace(second=0, microsecond=0)
+
+
+def _contribution(snap: CaseSnapshot):
+    assigned_to, status, sla_due_at = snap
+    is_open = status != "CLOSED"
+    counters = {
+        "total_count": 1,
+        "open_count": int(is_open),
+        "closed_count": int(not is_open),
+        "escalated_count": int(status == "ESCALATED"),
+        "sla_due_sum": 0.0,
+        "sla_due_n": 0,
+    }
+    bucket = None
+    if is_open and sla_due_at is not None:
+        counters["sla_due_sum"] = _as_utc(sla_due_at).timestamp()
+        counters["sla_due_n"] = 1
+        bucket = _bucket(sla_due_at)
+    return assigned_to or UNASSIGNED, counters, bucket
+
+
+def _upsert_add(db: Session, model, keys: dict, deltas: dict):
+    """INSERT the row with `deltas` as initial values, or add them to the existing row."""
+    dialect = db.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        stmt = (pg_insert if dialect == "postgresql" else sqlite_insert)(model).values(**keys, **deltas)
+        set_ = {k: model.__table__.c[k] + stmt.excluded[k] for k in deltas}
+        if "updated_at" in model.__table__.c:
+            set_["updated_at"] = func.now()
+        db.execute(stmt.on_conflict_do_update(index_elements=list(keys), set_=set_))
+        return
+
+    where = [model.__table__.c[k] == v for k, v in keys.items()]
+    res = db.execute(
+        update(model).where(*where).values({k: model.__table__.c[k] + v for k, v in deltas.items()})
+    )
+    if res.rowcount == 0:
+        db.execute(insert(model).values(**keys, **deltas))
+
+
+def record_case_change(db: Session, before: Optional[CaseSnapshot], after: Optional[CaseSnapshot]):
+    """
+    Stage the stats delta for one case going from `before` to `after`
+    (None = case did not exist / no longer exists). Does not commit; call it
+    before the commit that persists the case so both land together.
+    """
+    if before == after:
+        return
+
+    counters = defaultdict(lambda: defaultdict(float))
+    buckets = defaultdict(int)
+
+    for snap, sign in ((before, -1), (after, 1)):
+        if snap is None:
+            continue
+        analyst, contrib, bucket = _contribution(snap)
+        for k, v in contrib.items():
+            counters[analyst][k] += sign * v
+        if bucket is not None:
+            buckets[(analyst, bucket)] += sign
+
+    for analyst, deltas in counters.items():
+        deltas = {k: (v if k == "sla_due_sum" else int(v)) for k, v in deltas.items()}
+        if any(deltas.values()):
+            _upsert_add(db, AnalystStats, {"analyst": analyst}, deltas)
+
+    for (analyst, bucket), delta in buckets.items():
+        if delta:
+            _upsert_add(db, AnalystSlaBucket, {"analyst": analyst, "bucket_start": bucket}, {"open_count": delta})
+
+
+def get_analyst_stats(db: Session, analyst: Optional[str] = None, now: Optional[datetime] = None):
+    now = _as_utc(now or datetime.now(timezone.utc))
+
+    # Incremental updates leave all-zero rows behind (reconcile drops them), and the
+    # unassigned bucket is bookkeeping for the queue rather than an analyst
+    stats_stmt = select(AnalystStats).where(AnalystStats.total_count > 0, AnalystStats.analyst != UNASSIGNED)
+    bucket_stmt = select(
+        AnalystSlaBucket.analyst,
+        # Buckets are floored to the minute, so a bucket is only wholly overdue once it is a minute old
+        func.sum(
+            case(
+                (AnalystSlaBucket.bucket_start <= now - timedelta(minutes=1), AnalystSlaBucket.open_count),
+                else_=0,
+            )
+        ),
+        func.sum(
+            case(
+                (
+                    AnalystSlaBucket.bucket_start <= now + timedelta(minutes=DUE_SOON_MINUTES),
+                    AnalystSlaBucket.open_count,
+                ),
+                else_=0,
+            )
+        ),
+    ).group_by(AnalystSlaBucket.analyst)
+
+    if analyst is not None:
+        stats_stmt = stats_stmt.where(AnalystStats.analyst == analyst)
+        bucket_stmt = bucket_stmt.where(AnalystSlaBucket.analyst == analyst)
+
+    sla = {row[0]: (int(row[1] or 0), int(row[2] or 0)) for row in db.execute(bucket_stmt)}
+
+    out = []
+    for row in db.execute(stats_stmt.order_by(AnalystStats.analyst)).scalars():
+        overdue, due_soon = sla.get(row.analyst, (0, 0))
+        avg_sla = 0
+        if row.sla_due_n > 0:
+            # Negative once the open cases are past due on average, as on the analyst page
+            avg_sla = round((row.sla_due_sum / row.sla_due_n - now.timestamp()) / 60)
+        out.append(
+            {
+                "analyst": row.analyst,
+                "total": row.total_count,
+                "open": row.open_count,
+                "closed": row.closed_count,
+                "escalated": row.escalated_count,
+                "due_soon": due_soon,
+                "overdue": overdue,
+                "avg_sla_minutes": avg_sla,
+            }
+        )
+    return out
+
+
+def reconcile_analyst_stats(db: Session):
+    """
+    Rebuild both stats tables from `cases`, correcting any drift in the running
+    counters. Returns the number of analyst rows written, or None when another
+    worker is already reconciling.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        acquired = db.execute(select(func.pg_try_advisory_xact_lock(RECONCILE_LOCK_KEY))).scalar()
+        if not acquired:
+            db.rollback()
+            return None
+        # Hold off concurrent increments so they apply on top of the rebuilt rows, not before them
+        db.execute(text("LOCK TABLE analyst_stats, analyst_sla_buckets IN EXCLUSIVE MODE"))
+
+    analyst_key = func.coalesce(Case.assigned_to, UNASSIGNED)
+    totals = db.execute(
+        select(
+            analyst_key,
+            func.count(),
+            func.sum(case((Case.status != "CLOSED", 1), else_=0)),
+            func.sum(case((Case.status == "CLOSED", 1), else_=0)),
+            func.sum(case((Case.status == "ESCALATED", 1), else_=0)),
+        ).group_by(analyst_key)
+    ).all()
+
+    sla_sum = defaultdict(float)
+    sla_n = defaultdict(int)
+    buckets = defaultdict(int)
+    open_rows = db.execute(
+        select(analyst_key, Case.sla_due_at).where(Case.status != "CLOSED", Case.sla_due_at.is_not(None))
+    )
+    for analyst, due in open_rows:
+        sla_sum[analyst] += _as_utc(due).timestamp()
+        sla_n[analyst] += 1
+        buckets[(analyst, _bucket(due))] += 1
+
+    db.execute(delete(AnalystSlaBucket))
+    db.execute(delete(AnalystStats))
+
+    if totals:
+        db.execute(
+            insert(AnalystStats),
+            [
+                {
+                    "analyst": analyst,
+                    "total_count": total,
+                    "open_count": int(open_ or 0),
+                    "closed_count": int(closed or 0),
+                    "escalated_count": int(escalated or 0),
+                    "sla_due_sum": sla_sum[analyst],
+                    "sla_due_n": sla_n[analyst],
+                }
+                for analyst, total, open_, closed, escalated in totals
+            ],
+        )
+    if buckets:
+        db.execute(
+            insert(AnalystSlaBucket),
+            [{"analyst": a, "bucket_start": b, "open_count": n} for (a, b), n in buckets.items()],
+        )
+
+    db.commit()
+    return len(totals)
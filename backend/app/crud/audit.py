@@ -4,13 +4,14 @@ from sqlalchemy.orm import Session
 from sqlalchemy import select
 
 from app.models.audit import AuditLog
+from app.events import publish
 
 
-def add_audit(db: Session, action: str, meta: Optional[Dict[str, Any]] = None):
+def stage_audit(db: Session, action: str, meta: Optional[Dict[str, Any]] = None):
+    """Add an audit row to the caller's open transaction; it is written by the caller's commit."""
     obj = AuditLog(action=action, meta=meta)
     db.add(obj)
-    db.commit()
-    db.refresh(obj)
+    publish(db, "audit.created", {"action": action})
     return obj
 
 
@@ -0,0 +1,105 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select
+
+from app.models.transaction import Transaction
+from app.models.case import Case
+from app.models.note import Note
+from app.models.audit import AuditLog
+from app.schemas.transaction import TransactionOut
+from app.schemas.cases import CaseOut
+from app.schemas.note import NoteOut
+from app.schemas.audit import AuditOut
+from app.schemas.batch import BatchQuery
+
+
+# resource -> (model, default ordering, filterable columns, output schema);
+# orderings match the single-resource list_* crud functions
+RESOURCES = {
+    "transactions": (
+        Transaction,
+        Transaction.id.desc(),
+        ("tx_id", "user", "merchant", "country", "channel"),
+        TransactionOut,
+    ),
+    "cases": (Case, Case.updated_at.desc(), ("tx_id", "status", "severity", "assigned_to"), CaseOut),
+    "notes": (Note, Note.created_at.desc(), ("tx_id", "case_id", "author"), NoteOut),
+    "audit": (AuditLog, AuditLog.created_at.desc(), ("action",), AuditOut),
+}
+
+
+class BatchQueryError(ValueError):
+    pass
+
+
+def _coerce(col, value, label: str):
+    """Convert a JSON filter value to the column's Python type, or raise BatchQueryError."""
+    if value is None:
+        return None
+    py_type = col.type.python_type
+    try:
+        if py_type is bool:
+            if isinstance(value, str) and value.lower() in ("true", "false"):
+                return value.lower() == "true"
+            if isinstance(value, bool):
+                return value
+            raise ValueError
+        if py_type is int:
+            if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+                raise ValueError
+            return int(value)
+        if py_type is float:
+            if isinstance(value, bool):
+                raise ValueError
+            return float(value)
+        if py_type is str:
+            if isinstance(value, bool):
+                raise ValueError
+            return str(value)
+    except (TypeError, ValueError):
+        raise BatchQueryError(f"Invalid value for {label} filter: {value!r}")
+    raise BatchQueryError(f"{label} cannot be filtered on")
+
+
+def _run_query(db: Session, query: BatchQuery):
+    model, order_by, filterable, schema = RESOURCES[query.resource]
+
+    unknown = set(query.filters) - set(filterable)
+    if unknown:
+        raise BatchQueryError(f"Unsupported {query.resource} filter(s): {', '.join(sorted(unknown))}")
+
+    stmt = select(model)
+    for name, value in query.filters.items():
+        col = getattr(model, name)
+        label = f"{query.resource}.{name}"
+        if isinstance(value, list):
+            values = [_coerce(col, v, label) for v in value]
+            present = [v for v in values if v is not None]
+            cond = col.in_(present)
+            if len(present) != len(values):
+                cond = cond | col.is_(None)
+            stmt = stmt.where(cond)
+        else:
+            value = _coerce(col, value, label)
+            stmt = stmt.where(col.is_(None) if value is None else col == value)
+    stmt = stmt.order_by(order_by).limit(query.limit)
+
+    return [schema.model_validate(obj) for obj in db.execute(stmt).scalars().all()]
+
+
+def run_batch(db: Session, queries: list[BatchQuery]):
+    """
+    Run every sub-query on one connection inside a single read transaction so
+    the combined response reflects one consistent snapshot of the database.
+    """
+    keys = [q.key or q.resource for q in queries]
+    if len(set(keys)) != len(keys):
+        raise BatchQueryError("Batch query keys must be unique; set `key` when repeating a resource")
+
+    if db.get_bind().dialect.name == "postgresql":
+        # REPEATABLE READ pins one snapshot for every statement in the transaction
+        db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+
+    try:
+        return {key: _run_query(db, q) for key, q in zip(keys, queries)}
+    finally:
+        db.rollback()
@@ -1,9 +1,26 @@
+from datetime import datetime, timedelta, timezone
+
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
 from sqlalchemy import select
 
 from app.models.case import Case
 from app.schemas.cases import CaseCreate, CaseUpdate
-from app.crud.audit import add_audit
+from app.crud.audit import stage_audit
+from app.crud.analyst_stats import case_snapshot, record_case_change
+from app.db.uow import unit_of_work
+from app.events import publish
+
+
+# Statuses a case can be claimed from (unassigned work)
+QUEUE_STATUSES = ("NEW", "OPEN")
+
+# Default SLA window per severity when the caller does not pass sla_due_at
+SLA_MINUTES = {"RED": 60, "ORANGE": 120, "GREEN": 240}
+
+
+class CaseVersionConflict(Exception):
+    """Raised when a case was modified by someone else since the caller read it."""
 
 
 def list_cases(db: Session, limit: int = 200):
@@ -12,16 +29,24 @@ def list_cases(db: Session, limit: int = 200):
 
 
 def create_case(db: Session, payload: CaseCreate):
+    severity = payload.severity or "ORANGE"
+    sla_due_at = payload.sla_due_at or datetime.now(timezone.utc) + timedelta(
+        minutes=SLA_MINUTES.get(severity, SLA_MINUTES["ORANGE"])
+    )
     obj = Case(
         tx_id=payload.tx_id,
         priority=payload.priority,
+        severity=severity,
         assigned_to=payload.assigned_to,
+        sla_due_at=sla_due_at,
         status="OPEN",
     )
-    db.add(obj)
-    db.commit()
-    db.refresh(obj)
-    add_audit(db, action="case.create", meta={"case_id": obj.id, "tx_id": obj.tx_id})
+    with unit_of_work(db):
+        db.add(obj)
+        record_case_change(db, None, case_snapshot(obj))
+        db.flush()
+        publish(db, "case.created", {"id": obj.id, "tx_id": obj.tx_id})
+        stage_audit(db, action="case.create", meta={"case_id": obj.id, "tx_id": obj.tx_id})
     return obj
 
 
@@ -31,10 +56,50 @@ def update_case(db: Session, case_id: int, payload: CaseUpdate):
         return None
 
     data = payload.model_dump(exclude_unset=True)
-    for k, v in data.items():
-        setattr(obj, k, v)
+    expected_version = data.pop("version", None)
+    if expected_version is not None and expected_version != obj.version:
+        raise CaseVersionConflict(f"Case {case_id} is at version {obj.version}, not {expected_version}")
+
+    try:
+        with unit_of_work(db):
+            before = case_snapshot(obj)
+            for k, v in data.items():
+                setattr(obj, k, v)
+            record_case_change(db, before, case_snapshot(obj))
+            publish(db, "case.updated", {"id": obj.id, "tx_id": obj.tx_id, "changes": list(data)})
+            stage_audit(db, action="case.update", meta={"case_id": obj.id, "tx_id": obj.tx_id, "changes": data})
+    except StaleDataError as exc:
+        raise CaseVersionConflict(f"Case {case_id} was modified concurrently") from exc
+    return obj
+
+
+def claim_next_case(db: Session, analyst: str):
+    """
+    Atomically assign the next unassigned case to `analyst`.
+
+    Ordered by severity (RED first) then SLA deadline. Rows locked by other
+    claimers are skipped rather than waited on, so concurrent analysts never
+    block each other or receive the same case. The ORDER BY is exactly the
+    ix_cases_queue key, so Postgres reads the index in order and stops at the
+    first unlocked row instead of sorting the whole backlog.
+    """
+    stmt = (
+        select(Case)
+        .where(Case.assigned_to.is_(None), Case.status.in_(QUEUE_STATUSES))
+        .order_by(Case.severity_rank, Case.sla_due_at.asc().nulls_last(), Case.id)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+    )
+    obj = db.execute(stmt).scalars().first()
+    if not obj:
+        db.rollback()
+        return None
 
-    db.commit()
-    db.refresh(obj)
-    add_audit(db, action="case.update", meta={"case_id": obj.id, "tx_id": obj.tx_id, "changes": data})
+    with unit_of_work(db):
+        before = case_snapshot(obj)
+        obj.assigned_to = analyst
+        obj.status = "IN_REVIEW"
+        record_case_change(db, before, case_snapshot(obj))
+        publish(db, "case.updated", {"id": obj.id, "tx_id": obj.tx_id, "changes": ["assigned_to", "status"]})
+        stage_audit(db, action="case.claim", meta={"case_id": obj.id, "tx_id": obj.tx_id, "analyst": analyst})
     return obj
@@ -3,7 +3,10 @@ from sqlalchemy import select
 
 from app.models.note import Note
 from app.schemas.note import NoteUpsert
-from app.crud.audit import add_audit
+from app.crud.audit import stage_audit
+from app.crud.search import index_note
+from app.db.uow import unit_of_work
+from app.events import publish
 
 
 def list_notes(db: Session, tx_id: str, limit: int = 200):
@@ -13,8 +16,10 @@ def list_notes(db: Session, tx_id: str, limit: int = 200):
 
 def upsert_note(db: Session, payload: NoteUpsert):
     obj = Note(**payload.model_dump())
-    db.add(obj)
-    db.commit()
-    db.refresh(obj)
-    add_audit(db, action="note.create", meta={"tx_id": obj.tx_id, "note_id": obj.id})
+    with unit_of_work(db):
+        db.add(obj)
+        db.flush()
+        publish(db, "note.created", {"id": obj.id, "tx_id": obj.tx_id})
+        stage_audit(db, action="note.create", meta={"tx_id": obj.tx_id, "note_id": obj.id})
+    index_note(obj)
     return obj
@@ -0,0 +1,82 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select, text
+
+from app.models.note import Note
+from app.models.transaction import Transaction
+from app.search import search_index
+
+
+# Transaction columns indexed alongside Note.body
+TX_FIELDS = ("explanation", "merchant", "user_name")
+
+# Expressions must match the GIN indexes created in migration 3b7e9c15d2a8
+_PG_HITS = """
+    WITH q AS (SELECT websearch_to_tsquery('english', :q) AS tsq)
+    SELECT kind, id, tx_id, field, body AS text, score
+    FROM (
+        SELECT 'note' AS kind, n.id, n.tx_id, 'body' AS field, n.body,
+               ts_rank(to_tsvector('english', n.body), q.tsq) AS score
+        FROM notes n, q
+        WHERE to_tsvector('english', n.body) @@ q.tsq
+        UNION ALL
+        SELECT 'transaction', t.id, t.tx_id, 'explanation', t.explanation,
+               ts_rank(to_tsvector('english', coalesce(t.explanation, '')), q.tsq)
+        FROM transactions t, q
+        WHERE to_tsvector('english', coalesce(t.explanation, '')) @@ q.tsq
+        UNION ALL
+        SELECT 'transaction', t.id, t.tx_id, 'merchant', t.merchant, similarity(t.merchant, :q)
+        FROM transactions t
+        WHERE t.merchant % :q OR t.merchant ILIKE :like
+        UNION ALL
+        SELECT 'transaction', t.id, t.tx_id, 'user_name', t.user_name, similarity(t.user_name, :q)
+        FROM transactions t
+        WHERE t.user_name % :q OR t.user_name ILIKE :like
+    ) hits
+"""
+
+_PG_SEARCH = text(_PG_HITS + "ORDER BY score DESC, id DESC LIMIT :limit OFFSET :offset")
+
+# Counted separately so a page past the last hit still reports the real total
+_PG_COUNT = text(f"SELECT count(*) FROM ({_PG_HITS}) counted")
+
+
+def _like_pattern(q: str) -> str:
+    escaped = q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+# No event-bus subscription needed: the in-process index only serves
+# non-Postgres databases, which run with the single-process InMemoryBus, so
+# every write that can reach it is indexed inline by this worker.
+
+
+def index_note(obj: Note):
+    search_index.add("note", obj.id, "body", obj.tx_id, obj.body)
+
+
+def index_transaction(obj: Transaction):
+    for field in TX_FIELDS:
+        search_index.add("transaction", obj.id, field, obj.tx_id, getattr(obj, field))
+
+
+def _index_docs(db: Session):
+    for row in db.execute(select(Note.id, Note.tx_id, Note.body)):
+        yield ("note", row.id, "body", row.tx_id, row.body)
+    cols = [getattr(Transaction, f) for f in TX_FIELDS]
+    for row in db.execute(select(Transaction.id, Transaction.tx_id, *cols)):
+        for field in TX_FIELDS:
+            yield ("transaction", row.id, field, row.tx_id, getattr(row, field))
+
+
+def search(db: Session, q: str, limit: int = 20, offset: int = 0):
+    """Ranked hits over note bodies and transaction explanation / merchant / user_name."""
+    if db.get_bind().dialect.name == "postgresql":
+        params = {"q": q, "like": _like_pattern(q)}
+        total = db.execute(_PG_COUNT, params).scalar()
+        items = db.execute(_PG_SEARCH, {**params, "limit": limit, "offset": offset}).mappings().all()
+        return {"total": total, "items": [dict(r) for r in items]}
+
+    if not search_index.built:
+        search_index.rebuild(_index_docs(db))
+    total, items = search_index.search(q, limit=limit, offset=offset)
+    return {"total": total, "items": items}
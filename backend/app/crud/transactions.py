@@ -3,7 +3,10 @@ from sqlalchemy import select
 
 from app.models.transaction import Transaction
 from app.schemas.transaction import TransactionCreate
-from app.crud.audit import add_audit
+from app.crud.audit import stage_audit
+from app.crud.search import index_transaction
+from app.db.uow import unit_of_work
+from app.events import publish
 
 
 def list_transactions(db: Session, limit: int = 200):
@@ -13,8 +16,10 @@ def list_transactions(db: Session, limit: int = 200):
 
 def create_transaction(db: Session, payload: TransactionCreate):
     obj = Transaction(**payload.model_dump())
-    db.add(obj)
-    db.commit()
-    db.refresh(obj)
-    add_audit(db, action="transaction.create", meta={"tx_id": obj.tx_id})
+    with unit_of_work(db):
+        db.add(obj)
+        db.flush()
+        publish(db, "transaction.created", {"id": obj.id, "tx_id": obj.tx_id})
+        stage_audit(db, action="transaction.create", meta={"tx_id": obj.tx_id})
+    index_transaction(obj)
     return obj
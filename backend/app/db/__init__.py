@@ -1,2 +1,3 @@
 from app.db.base import Base
-from app.db.session import engine, SessionLocal, get_db
+from app.db.session import SessionLocal, init_db, get_engine, get_replicas, get_db
+from app.db.uow import unit_of_work
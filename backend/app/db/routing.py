@@ -0,0 +1,87 @@
+import itertools
+import logging
+import threading
+import time
+from typing import List, Optional
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine, make_url
+
+log = logging.getLogger(__name__)
+
+
+class ReplicaSet:
+    """
+    Read replicas with round-robin selection and health checking. A replica
+    is taken out of rotation when a health probe or any query on it fails
+    with a connection error, and re-probed after `check_interval` seconds.
+
+    Probes run on the request thread, so Postgres replicas connect with a short
+    `connect_timeout`: one that silently drops packets costs a GET at most that
+    long (instead of the OS TCP timeout) before the read falls back to the primary.
+    """
+
+    def __init__(self, urls: List[str], check_interval: float = 10.0, connect_timeout: int = 2):
+        self.check_interval = check_interval
+        self.engines: List[Engine] = [self._create_engine(url, connect_timeout) for url in urls]
+        self._healthy = {id(e): True for e in self.engines}
+        self._checked_at = {id(e): time.monotonic() for e in self.engines}
+        self._lock = threading.Lock()
+        self._rr = itertools.cycle(range(len(self.engines))) if self.engines else None
+
+        for eng in self.engines:
+            event.listen(eng, "handle_error", self._on_error(eng))
+
+    @staticmethod
+    def _create_engine(url: str, connect_timeout: int) -> Engine:
+        connect_args = {}
+        if make_url(url).get_backend_name() == "postgresql":
+            # libpq option, honoured by both psycopg2 and psycopg 3
+            connect_args["connect_timeout"] = connect_timeout
+        return create_engine(url, future=True, pool_pre_ping=True, connect_args=connect_args)
+
+    def _on_error(self, eng: Engine):
+        def handler(ctx):
+            if ctx.is_disconnect:
+                self.mark_down(eng)
+
+        return handler
+
+    def mark_down(self, eng: Engine):
+        with self._lock:
+            if self._healthy.get(id(eng)):
+                log.warning("read replica %s marked unhealthy", eng.url.render_as_string(hide_password=True))
+            self._healthy[id(eng)] = False
+            self._checked_at[id(eng)] = time.monotonic()
+
+    def _probe(self, eng: Engine) -> bool:
+        try:
+            with eng.connect() as conn:
+                conn.execute(text("SELECT 1"))
+            return True
+        except Exception:
+            return False
+
+    def _is_healthy(self, eng: Engine) -> bool:
+        key = id(eng)
+        with self._lock:
+            due = time.monotonic() - self._checked_at[key] >= self.check_interval
+            if due:
+                # Claim the probe so concurrent requests don't all run it
+                self._checked_at[key] = time.monotonic()
+        if due:
+            ok = self._probe(eng)
+            with self._lock:
+                self._healthy[key] = ok
+        return self._healthy[key]
+
+    def pick(self) -> Optional[Engine]:
+        """Next healthy replica, or None when there are none (caller falls back to the primary)."""
+        if not self.engines:
+            return None
+        for _ in range(len(self.engines)):
+            with self._lock:
+                eng = self.engines[next(self._rr)]
+            if self._is_healthy(eng):
+                return eng
+        return None
@@ -1,24 +1,54 @@
-import os
+import threading
+from typing import Optional
 
-from dotenv import load_dotenv
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
 
-# Load backend/.env
-load_dotenv()
+from app.db.routing import ReplicaSet
+from app.settings import get_settings
 
-DATABASE_URL = os.getenv("DATABASE_URL")
-if not DATABASE_URL:
-    raise RuntimeError("DATABASE_URL not set. Create backend/.env and set DATABASE_URL.")
+# Bound to the primary engine by init_db(); nothing connects at import time
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, future=True)
 
-engine = create_engine(DATABASE_URL, future=True)
+_engine: Optional[Engine] = None
+_replicas: Optional[ReplicaSet] = None
+_init_lock = threading.Lock()
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, future=True)
+
+def init_db() -> Engine:
+    """Create the primary engine and replica set on first call; later calls are no-ops."""
+    global _engine, _replicas
+    if _engine is not None:
+        return _engine
+    with _init_lock:
+        if _engine is None:
+            settings = get_settings()
+            engine = create_engine(settings.require_database_url(), future=True)
+            _replicas = ReplicaSet(
+                settings.replica_urls,
+                check_interval=settings.replica_healthcheck_seconds,
+                connect_timeout=settings.replica_connect_timeout_seconds,
+            )
+            SessionLocal.configure(bind=engine)
+            _engine = engine
+    return _engine
+
+
+def get_engine() -> Engine:
+    return init_db()
+
+
+def get_replicas() -> ReplicaSet:
+    init_db()
+    return _replicas
 
 
 def get_db():
+    init_db()
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
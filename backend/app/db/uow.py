@@ -0,0 +1,21 @@
+from contextlib import contextmanager
+
+from sqlalchemy.orm import Session
+
+
+@contextmanager
+def unit_of_work(db: Session):
+    """
+    One transaction for an entity write and everything staged alongside it
+    (audit row, stats deltas, events): commits once on exit, rolls back on error.
+
+    Sessions are created with expire_on_commit=False and models use
+    eager_defaults, so server-generated columns come back via INSERT/UPDATE
+    ... RETURNING and objects stay readable after commit without a refresh.
+    """
+    try:
+        yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
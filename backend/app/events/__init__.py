@@ -0,0 +1,3 @@
+from app.events.bus import EventBus, InMemoryBus, PostgresBus, get_bus, publish
+
+__all__ = ["EventBus", "InMemoryBus", "PostgresBus", "get_bus", "publish"]
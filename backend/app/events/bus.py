@@ -0,0 +1,230 @@
+import json
+import logging
+import select as _select
+import threading
+import uuid
+from collections import defaultdict
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import event, func, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.settings import get_settings
+
+log = logging.getLogger(__name__)
+
+# Pending events ride on the session and go out only if it commits
+_PENDING_KEY = "event_bus_pending"
+
+# handler(topic, payload, local) -- local is True for events published by this process
+Handler = Callable[[str, Dict[str, Any], bool], None]
+
+
+class EventBus:
+    """
+    Fan-out of write events to every worker. Crud code calls `publish` while
+    its transaction is open; subscribers in *all* processes see the event
+    once that transaction commits, and never if it rolls back.
+    """
+
+    def __init__(self):
+        self.origin = uuid.uuid4().hex
+        self._handlers: Dict[str, list] = defaultdict(list)
+
+    def subscribe(self, topic: str, handler: Handler):
+        """`topic` is an exact name like "note.created", a prefix like "case.", or "*"."""
+        self._handlers[topic].append(handler)
+
+    @property
+    def has_subscribers(self) -> bool:
+        return any(self._handlers.values())
+
+    def publish(self, db: Session, topic: str, payload: Optional[Dict[str, Any]] = None):
+        if not db.in_transaction():
+            # Tie the event to a transaction so a rollback is guaranteed to drop it
+            db.begin()
+        db.info.setdefault(_PENDING_KEY, []).append({"topic": topic, "payload": payload or {}, "origin": self.origin})
+
+    def _dispatch(self, envelope: Dict[str, Any]):
+        topic = envelope["topic"]
+        local = envelope.get("origin") == self.origin
+        for key, handlers in list(self._handlers.items()):
+            if key == "*" or key == topic or (key.endswith(".") and topic.startswith(key)):
+                for handler in handlers:
+                    try:
+                        handler(topic, envelope["payload"], local)
+                    except Exception:
+                        log.exception("event handler failed for %s", topic)
+
+    # Session hooks -- overridden per backend
+    def _before_commit(self, session: Session, events: list):
+        pass
+
+    def _after_commit(self, session: Session, events: list):
+        pass
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+
+class InMemoryBus(EventBus):
+    """Single-process backend: dispatches straight to local subscribers after commit."""
+
+    def _after_commit(self, session: Session, events: list):
+        for envelope in events:
+            self._dispatch(envelope)
+
+
+class PostgresBus(EventBus):
+    """
+    LISTEN/NOTIFY backend. A transaction's events are sent together as one
+    pg_notify statement before it commits, so Postgres delivers them to every
+    listening worker (this one included) exactly when the write becomes visible.
+
+    Every worker runs the same code and so registers the same subscriptions:
+    while this one has none, nothing is listening anywhere, and the bus neither
+    sends notifications nor holds a LISTEN connection.
+    """
+
+    CHANNEL = "gp_events"
+
+    # NOTIFY payloads are capped at 8000 bytes; larger batches are split
+    MAX_PAYLOAD = 7900
+
+    # DBAPI drivers whose notification API _listen knows how to drive
+    DRIVERS = ("psycopg2", "psycopg")
+
+    def __init__(self, engine: Engine, poll_seconds: float = 5.0):
+        super().__init__()
+        self.engine = engine
+        self.poll_seconds = poll_seconds
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._started = False
+
+    def subscribe(self, topic: str, handler: Handler):
+        super().subscribe(topic, handler)
+        if self._started:
+            self._start_listener()
+
+    def _payloads(self, events: list):
+        batch, size = [], 2
+        for envelope in events:
+            encoded = json.dumps(envelope, default=str)
+            if batch and size + len(encoded) + 1 > self.MAX_PAYLOAD:
+                yield "[" + ",".join(batch) + "]"
+                batch, size = [], 2
+            batch.append(encoded)
+            size += len(encoded) + 1
+        if batch:
+            yield "[" + ",".join(batch) + "]"
+
+    def _before_commit(self, session: Session, events: list):
+        if not self.has_subscribers:
+            return
+        # One round trip however many events the transaction published
+        session.execute(select(*(func.pg_notify(self.CHANNEL, p) for p in self._payloads(events))))
+
+    def start(self):
+        driver = self.engine.dialect.driver
+        if driver not in self.DRIVERS:
+            raise RuntimeError(
+                f"PostgresBus needs one of the {', '.join(self.DRIVERS)} drivers to LISTEN, not {driver!r}; "
+                "use a postgresql+psycopg2:// or postgresql+psycopg:// DATABASE_URL, or EVENT_BUS=memory"
+            )
+        self._started = True
+        self._start_listener()
+
+    def _start_listener(self):
+        if self._thread is not None or not self.has_subscribers:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._listen_forever, name="event-bus-listener", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._started = False
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_seconds + 1)
+            self._thread = None
+
+    def _listen_forever(self):
+        while not self._stop.is_set():
+            try:
+                self._listen()
+            except Exception:
+                log.exception("event bus listener lost its connection; reconnecting")
+                self._stop.wait(1.0)
+
+    def _listen(self):
+        with self.engine.connect() as conn:
+            # Detached: closed on exit instead of going back to the pool still
+            # LISTENing and in autocommit, where a unit_of_work could pick it up
+            conn.execution_options(isolation_level="AUTOCOMMIT")
+            conn.detach()
+            conn.exec_driver_sql(f"LISTEN {self.CHANNEL}")
+            pg = conn.connection.dbapi_connection
+            while not self._stop.is_set():
+                for payload in self._wait(pg):
+                    try:
+                        envelopes = json.loads(payload)
+                    except ValueError:
+                        log.warning("dropping malformed event payload: %r", payload)
+                        continue
+                    for envelope in envelopes:
+                        self._dispatch(envelope)
+
+    def _wait(self, pg):
+        """Payloads received within one poll interval (possibly none)."""
+        if self.engine.dialect.driver == "psycopg":
+            # psycopg 3.2+: generator that returns once the timeout passes
+            return [note.payload for note in pg.notifies(timeout=self.poll_seconds)]
+        if _select.select([pg], [], [], self.poll_seconds) == ([], [], []):
+            return []
+        pg.poll()
+        payloads = [note.payload for note in pg.notifies]
+        pg.notifies.clear()
+        return payloads
+
+
+_bus: Optional[EventBus] = None
+
+
+def get_bus() -> EventBus:
+    """Process-wide bus. EVENT_BUS=postgres|memory; defaults to postgres on a Postgres DATABASE_URL."""
+    global _bus
+    if _bus is None:
+        from app.db import get_engine
+
+        engine = get_engine()
+        kind = get_settings().event_bus or ("postgres" if engine.dialect.name == "postgresql" else "memory")
+        _bus = PostgresBus(engine) if kind == "postgres" else InMemoryBus()
+    return _bus
+
+
+def publish(db: Session, topic: str, payload: Optional[Dict[str, Any]] = None):
+    get_bus().publish(db, topic, payload)
+
+
+@event.listens_for(Session, "before_commit")
+def _on_before_commit(session: Session):
+    events = session.info.get(_PENDING_KEY)
+    if events:
+        get_bus()._before_commit(session, events)
+
+
+@event.listens_for(Session, "after_commit")
+def _on_after_commit(session: Session):
+    events = session.info.pop(_PENDING_KEY, None)
+    if events:
+        get_bus()._after_commit(session, events)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _on_rollback(session: Session, previous_transaction):
+    session.info.pop(_PENDING_KEY, None)
@@ -1,9 +1,62 @@
-from fastapi import FastAPI
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.concurrency import run_in_threadpool
+
+from app.settings import get_settings
+from app.db import SessionLocal, init_db
+from app.crud.analyst_stats import reconcile_analyst_stats
+from app.events import get_bus
+from app.routes import transactions, notes, audit, cases, analysts, search, batch
+from app.routes.deps import LAST_WRITE_COOKIE, LAST_WRITE_HEADER
+
+log = logging.getLogger(__name__)
+
+
+def _reconcile_once():
+    db = SessionLocal()
+    try:
+        reconcile_analyst_stats(db)
+    finally:
+        db.close()
+
+
+async def _reconcile_stats_forever(interval: float):
+    while True:
+        try:
+            await run_in_threadpool(_reconcile_once)
+        except Exception:
+            log.exception("analyst stats reconciliation failed")
+        await asyncio.sleep(interval)
 
-from app.routes import transactions, notes, audit, cases
 
-app = FastAPI(title="GP-Interface API", version="0.1.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Engines, replicas and the event bus are built here rather than at import time
+    settings = get_settings()
+    init_db()
+
+    bus = get_bus()
+    bus.start()
+
+    interval = settings.analyst_stats_reconcile_seconds
+    task = asyncio.create_task(_reconcile_stats_forever(interval)) if interval > 0 else None
+    yield
+    if task:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    # stop() joins the listener thread; keep that off the event loop
+    await run_in_threadpool(bus.stop)
+
+
+app = FastAPI(title="GP-Interface API", version="0.1.0", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -11,12 +64,30 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[LAST_WRITE_HEADER],
 )
 
+
+@app.middleware("http")
+async def mark_writes(request: Request, call_next):
+    # Stamp successful writes so the client's next reads stick to the primary (see get_read_db)
+    response = await call_next(request)
+    is_write = request.method not in ("GET", "HEAD", "OPTIONS") and not getattr(request.state, "read_only", False)
+    if is_write and response.status_code < 400:
+        stamp = f"{time.time():.3f}"
+        max_age = max(1, int(get_settings().read_your_writes_seconds))
+        response.headers[LAST_WRITE_HEADER] = stamp
+        response.set_cookie(LAST_WRITE_COOKIE, stamp, max_age=max_age, httponly=True)
+    return response
+
+
 app.include_router(transactions.router)
 app.include_router(notes.router)
 app.include_router(audit.router)
 app.include_router(cases.router)
+app.include_router(analysts.router)
+app.include_router(search.router)
+app.include_router(batch.router)
 
 
 @app.get("/health")
@@ -2,5 +2,6 @@ from .transaction import Transaction
 from .note import Note
 from .audit import AuditLog
 from .case import Case
+from .analyst_stats import AnalystStats, AnalystSlaBucket
 
-__all__ = ["Transaction", "Note", "AuditLog", "Case"]
+__all__ = ["Transaction", "Note", "AuditLog", "Case", "AnalystStats", "AnalystSlaBucket"]
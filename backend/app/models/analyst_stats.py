@@ -0,0 +1,33 @@
+from sqlalchemy import Column, Integer, String, Float, DateTime
+from sqlalchemy.sql import func
+
+from app.db import Base
+
+
+class AnalystStats(Base):
+    """Running per-analyst case counters, maintained by the case crud functions."""
+
+    __tablename__ = "analyst_stats"
+
+    analyst = Column(String(255), primary_key=True)
+
+    total_count = Column(Integer, nullable=False, server_default="0")
+    open_count = Column(Integer, nullable=False, server_default="0")
+    closed_count = Column(Integer, nullable=False, server_default="0")
+    escalated_count = Column(Integer, nullable=False, server_default="0")
+
+    # Sum / count of sla_due_at (epoch seconds) over open cases -> avg SLA remaining
+    sla_due_sum = Column(Float, nullable=False, server_default="0")
+    sla_due_n = Column(Integer, nullable=False, server_default="0")
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+
+class AnalystSlaBucket(Base):
+    """Open cases per analyst, histogrammed by the minute their SLA falls due."""
+
+    __tablename__ = "analyst_sla_buckets"
+
+    analyst = Column(String(255), primary_key=True)
+    bucket_start = Column(DateTime(timezone=True), primary_key=True)
+    open_count = Column(Integer, nullable=False, server_default="0")
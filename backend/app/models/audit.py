@@ -11,3 +11,5 @@ class AuditLog(Base):
     action = Column(String(200), nullable=False)
     meta = Column(JSON, nullable=True)
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
+
+    __mapper_args__ = {"eager_defaults": True}
@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
-from sqlalchemy.sql import func
+from sqlalchemy import Column, Computed, Integer, String, Text, DateTime, ForeignKey, Index
+from sqlalchemy.sql import func, text
 from sqlalchemy.orm import relationship
 
 from app.db import Base
@@ -14,13 +14,38 @@ class Case(Base):
 
     status = Column(String(20), nullable=False, server_default="NEW")
     severity = Column(String(10), nullable=False, server_default="ORANGE")
+    # Queue sort key (RED first), kept by the database so the claim query can walk ix_cases_queue
+    severity_rank = Column(
+        Integer,
+        Computed("CASE severity WHEN 'RED' THEN 0 WHEN 'ORANGE' THEN 1 WHEN 'GREEN' THEN 2 ELSE 3 END", persisted=True),
+    )
+    priority = Column(String(20), nullable=True)
 
     assigned_to = Column(String(255), nullable=True)
     decision = Column(String(10), nullable=True)  # APPROVE / REJECT
     decision_reason = Column(Text, nullable=True)
 
+    sla_due_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Optimistic concurrency: every UPDATE is guarded by "WHERE version = :old"
+    version = Column(Integer, nullable=False, server_default="1")
+
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
     transaction = relationship("Transaction", back_populates="cases")
     notes = relationship("Note", back_populates="case", cascade="all, delete-orphan")
+
+    __mapper_args__ = {"version_id_col": version, "eager_defaults": True}
+
+    __table_args__ = (
+        # Work queue lookup: unassigned cases in claim order (btree ASC already sorts NULLs last)
+        Index(
+            "ix_cases_queue",
+            "severity_rank",
+            "sla_due_at",
+            "id",
+            postgresql_where=text("assigned_to IS NULL AND status IN ('NEW', 'OPEN')"),
+            sqlite_where=text("assigned_to IS NULL AND status IN ('NEW', 'OPEN')"),
+        ),
+    )
@@ -20,3 +20,5 @@ class Note(Base):
 
     transaction = relationship("Transaction", back_populates="notes")
     case = relationship("Case", back_populates="notes")
+
+    __mapper_args__ = {"eager_defaults": True}
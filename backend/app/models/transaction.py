@@ -41,3 +41,7 @@ class Transaction(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     cases = relationship("Case", back_populates="transaction", cascade="all, delete-orphan")
+    notes = relationship("Note", back_populates="transaction")
+
+    # Fetch server defaults (id, created_at) via RETURNING on insert instead of a refresh
+    __mapper_args__ = {"eager_defaults": True}
@@ -0,0 +1,20 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from app.routes.deps import get_read_db
+from app.schemas.analyst_stats import AnalystStatsOut
+from app.crud.analyst_stats import get_analyst_stats
+
+router = APIRouter(prefix="/api/analysts", tags=["analysts"])
+
+
+@router.get("/stats", response_model=list[AnalystStatsOut])
+def get_all_stats(db: Session = Depends(get_read_db)):
+    return get_analyst_stats(db)
+
+
+@router.get("/{analyst}/stats", response_model=AnalystStatsOut)
+def get_stats(analyst: str, db: Session = Depends(get_read_db)):
+    rows = get_analyst_stats(db, analyst=analyst)
+    # An analyst with no cases yet simply has all-zero stats
+    return rows[0] if rows else AnalystStatsOut(analyst=analyst)
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
-from app.db import get_db
+from app.routes.deps import get_read_db
 from app.schemas.audit import AuditOut
 from app.crud.audit import list_audit
 
@@ -9,5 +9,5 @@ router = APIRouter(prefix="/api/audit", tags=["audit"])
 
 
 @router.get("/", response_model=list[AuditOut])
-def get_all(limit: int = 200, db: Session = Depends(get_db)):
+def get_all(limit: int = 200, db: Session = Depends(get_read_db)):
     return list_audit(db, limit=limit)
@@ -0,0 +1,16 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+
+from app.routes.deps import get_read_db
+from app.schemas.batch import BatchRequest, BatchResponse
+from app.crud.batch import run_batch, BatchQueryError
+
+router = APIRouter(prefix="/api/batch", tags=["batch"])
+
+
+@router.post("/", response_model=BatchResponse)
+def batch(payload: BatchRequest, db: Session = Depends(get_read_db)):
+    try:
+        return {"results": run_batch(db, payload.queries)}
+    except BatchQueryError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
@@ -2,14 +2,15 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
 from app.db import get_db
-from app.schemas.cases import CaseCreate, CaseUpdate, CaseOut
-from app.crud.cases import list_cases, create_case, update_case
+from app.routes.deps import get_read_db
+from app.schemas.cases import CaseCreate, CaseUpdate, CaseClaim, CaseOut
+from app.crud.cases import list_cases, create_case, update_case, claim_next_case, CaseVersionConflict
 
 router = APIRouter(prefix="/api/cases", tags=["cases"])
 
 
 @router.get("/", response_model=list[CaseOut])
-def get_all(limit: int = 200, db: Session = Depends(get_db)):
+def get_all(limit: int = 200, db: Session = Depends(get_read_db)):
     return list_cases(db, limit=limit)
 
 
@@ -18,9 +19,20 @@ def create(payload: CaseCreate, db: Session = Depends(get_db)):
     return create_case(db, payload)
 
 
+@router.post("/claim", response_model=CaseOut)
+def claim(payload: CaseClaim, db: Session = Depends(get_db)):
+    obj = claim_next_case(db, payload.analyst)
+    if not obj:
+        raise HTTPException(status_code=404, detail="No cases waiting in the queue")
+    return obj
+
+
 @router.patch("/{case_id}", response_model=CaseOut)
 def patch(case_id: int, payload: CaseUpdate, db: Session = Depends(get_db)):
-    obj = update_case(db, case_id, payload)
+    try:
+        obj = update_case(db, case_id, payload)
+    except CaseVersionConflict as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
     if not obj:
         raise HTTPException(status_code=404, detail="Case not found")
     return obj
@@ -0,0 +1,29 @@
+import time
+
+from fastapi import Request
+
+from app.db import SessionLocal, get_replicas
+from app.settings import get_settings
+
+# Cookie / header carrying the client's last write time (epoch seconds)
+LAST_WRITE_COOKIE = "gp_last_write"
+LAST_WRITE_HEADER = "X-Last-Write-At"
+
+
+def _wrote_recently(request: Request) -> bool:
+    raw = request.headers.get(LAST_WRITE_HEADER) or request.cookies.get(LAST_WRITE_COOKIE)
+    try:
+        return raw is not None and time.time() - float(raw) < get_settings().read_your_writes_seconds
+    except ValueError:
+        return False
+
+
+def get_read_db(request: Request):
+    """Session for read-only handlers: a healthy replica unless the client just wrote."""
+    request.state.read_only = True
+    bind = None if _wrote_recently(request) else get_replicas().pick()
+    db = SessionLocal(bind=bind) if bind is not None else SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
 from app.db import get_db
+from app.routes.deps import get_read_db
 from app.schemas.transaction import TransactionOut, TransactionCreate
 from app.crud.transactions import list_transactions, create_transaction
 
@@ -9,7 +10,7 @@ router = APIRouter(prefix="/api/transactions", tags=["transactions"])
 
 
 @router.get("/", response_model=list[TransactionOut])
-def get_all(limit: int = 200, db: Session = Depends(get_db)):
+def get_all(limit: int = 200, db: Session = Depends(get_read_db)):
     return list_transactions(db, limit=limit)
 
 
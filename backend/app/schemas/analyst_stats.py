@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+
+
+class AnalystStatsOut(BaseModel):
+    analyst: str
+    total: int = 0
+    open: int = 0
+    closed: int = 0
+    escalated: int = 0
+    due_soon: int = 0
+    overdue: int = 0
+    avg_sla_minutes: int = 0
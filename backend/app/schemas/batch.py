@@ -0,0 +1,23 @@
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Literal, Optional, Union
+
+
+Scalar = Union[bool, int, float, str, None]
+# A list value matches any of its items (SQL IN)
+FilterValue = Union[Scalar, List[Scalar]]
+
+
+class BatchQuery(BaseModel):
+    resource: Literal["transactions", "cases", "notes", "audit"]
+    # Name of this query's entry in the response; defaults to the resource name
+    key: Optional[str] = None
+    filters: Dict[str, FilterValue] = Field(default_factory=dict)
+    limit: int = Field(200, ge=1, le=500)
+
+
+class BatchRequest(BaseModel):
+    queries: List[BatchQuery] = Field(..., min_length=1, max_length=20)
+
+
+class BatchResponse(BaseModel):
+    results: Dict[str, List[Any]]
@@ -6,13 +6,21 @@ from datetime import datetime
 class CaseCreate(BaseModel):
     tx_id: str
     priority: Optional[str] = "MEDIUM"
+    severity: Optional[str] = "ORANGE"
     assigned_to: Optional[str] = None
+    sla_due_at: Optional[datetime] = None
 
 
 class CaseUpdate(BaseModel):
     status: Optional[str] = None
     priority: Optional[str] = None
     assigned_to: Optional[str] = None
+    # Version the client last saw; the update is rejected if the case moved on since
+    version: Optional[int] = None
+
+
+class CaseClaim(BaseModel):
+    analyst: str
 
 
 class CaseOut(BaseModel):
@@ -20,7 +28,10 @@ class CaseOut(BaseModel):
     tx_id: str
     status: str
     priority: Optional[str] = None
+    severity: Optional[str] = None
     assigned_to: Optional[str] = None
+    sla_due_at: Optional[datetime] = None
+    version: int
     created_at: datetime
     updated_at: datetime
 
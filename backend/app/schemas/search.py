@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+
+
+class SearchHit(BaseModel):
+    kind: str  # "note" | "transaction"
+    id: int
+    tx_id: str
+    field: str
+    text: str
+    score: float
+
+
+class SearchResults(BaseModel):
+    total: int
+    items: list[SearchHit]
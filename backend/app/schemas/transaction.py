@@ -4,6 +4,31 @@ from typing import Any, Optional
 from pydantic import BaseModel, ConfigDict
 
 
+class TransactionCreate(BaseModel):
+    tx_id: str
+    user: str
+
+    amount: float
+    country: Optional[str] = None
+    device: Optional[str] = None
+    channel: Optional[str] = None
+    merchant: Optional[str] = None
+    card_type: Optional[str] = None
+    hour: Optional[int] = None
+
+    ts: datetime
+
+    risk: Optional[float] = None
+    label: Optional[int] = None
+    explanation: Optional[str] = None
+    shap_top: Optional[Any] = None
+
+    currency: Optional[str] = None
+    velocity: Optional[int] = None
+    device_new: Optional[bool] = None
+    user_name: Optional[str] = None
+
+
 class TransactionOut(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
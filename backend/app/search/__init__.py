@@ -0,0 +1,3 @@
+from app.search.index import InvertedIndex, search_index
+
+__all__ = ["InvertedIndex", "search_index"]
@@ -0,0 +1,131 @@
+import heapq
+import math
+import re
+import threading
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+# (kind, row id, field) -- one indexed document per searchable column
+DocKey = Tuple[str, int, str]
+
+# (kind, row id, field, tx_id, text) -- the arguments to InvertedIndex.add
+Doc = Tuple[str, int, str, str, Optional[str]]
+
+
+def tokenize(text: Optional[str]):
+    return _TOKEN.findall((text or "").lower())
+
+
+class InvertedIndex:
+    """
+    In-process term -> postings index used when the database has no full-text
+    support (SQLite, tests). Built from the DB by `rebuild` on first search,
+    then kept current by the crud write paths calling `add`.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._postings: Dict[str, Dict[DocKey, int]] = defaultdict(dict)
+        self._docs: Dict[DocKey, Tuple[str, str]] = {}  # key -> (tx_id, text)
+        self.built = False
+        self._building = 0
+        # Writes seen while a rebuild is scanning; replayed on top of its snapshot
+        self._pending: List[Doc] = []
+
+    def add(self, kind: str, row_id: int, field: str, tx_id: str, text: Optional[str]):
+        """Index one document. A no-op until the index is built, except during a rebuild."""
+        with self._lock:
+            if self.built:
+                self._add(kind, row_id, field, tx_id, text)
+            elif self._building:
+                self._pending.append((kind, row_id, field, tx_id, text))
+
+    def _add(self, kind: str, row_id: int, field: str, tx_id: str, text: Optional[str]):
+        if not text:
+            return
+        key = (kind, row_id, field)
+        with self._lock:
+            self._remove(key)
+            self._docs[key] = (tx_id, text)
+            tf = defaultdict(int)
+            for term in tokenize(text):
+                tf[term] += 1
+            for term, n in tf.items():
+                self._postings[term][key] = n
+
+    def _remove(self, key: DocKey):
+        old = self._docs.pop(key, None)
+        if old is None:
+            return
+        for term in set(tokenize(old[1])):
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(key, None)
+                if not postings:
+                    del self._postings[term]
+
+    def rebuild(self, docs: Iterable[Doc]):
+        """
+        Index `docs` into a fresh index off-lock, then swap it in. Searches see
+        either the old contents or the complete new ones, never a partial build.
+        """
+        with self._lock:
+            self._building += 1
+
+        fresh = InvertedIndex()
+        try:
+            for doc in docs:
+                fresh._add(*doc)
+        finally:
+            with self._lock:
+                self._building -= 1
+
+        with self._lock:
+            self._postings, self._docs = fresh._postings, fresh._docs
+            for doc in self._pending:
+                self._add(*doc)
+            if not self._building:
+                self._pending = []
+            self.built = True
+
+    def search(self, query: str, limit: int = 20, offset: int = 0):
+        """Docs containing every query term, ranked by TF-IDF. Returns (total, hits)."""
+        terms = set(tokenize(query))
+        if not terms:
+            return 0, []
+
+        with self._lock:
+            postings = [self._postings.get(t) for t in terms]
+            if not all(postings):
+                return 0, []
+            postings.sort(key=len)  # intersect from the rarest term outwards
+            n_docs = len(self._docs)
+
+            scores = {}
+            for key, tf in postings[0].items():
+                if all(key in p for p in postings[1:]):
+                    scores[key] = 0.0
+            for p in postings:
+                idf = math.log(1 + n_docs / len(p))
+                for key in scores:
+                    scores[key] += (1 + math.log(p[key])) * idf
+
+            top = heapq.nsmallest(offset + limit, scores.items(), key=lambda kv: (-kv[1], -kv[0][1]))
+            page = top[offset:]
+            hits = [
+                {
+                    "kind": kind,
+                    "id": row_id,
+                    "field": field,
+                    "tx_id": self._docs[(kind, row_id, field)][0],
+                    "text": self._docs[(kind, row_id, field)][1],
+                    "score": round(score, 4),
+                }
+                for (kind, row_id, field), score in page
+            ]
+            return len(scores), hits
+
+
+search_index = InvertedIndex()
@@ -0,0 +1,51 @@
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import List, Optional
+
+from dotenv import load_dotenv
+
+
+def _csv(value: Optional[str]) -> List[str]:
+    return [v.strip() for v in (value or "").split(",") if v.strip()]
+
+
+@dataclass(frozen=True)
+class Settings:
+    database_url: Optional[str] = None
+    # Comma-separated read replica URLs; empty means every read goes to the primary
+    replica_urls: List[str] = field(default_factory=list)
+    replica_healthcheck_seconds: float = 10.0
+    # Upper bound on connecting to a replica before it is treated as down
+    replica_connect_timeout_seconds: int = 2
+    # After a client writes, its reads stay on the primary this long so it sees its own writes
+    read_your_writes_seconds: float = 5.0
+    # How often the running analyst counters are rebuilt from the cases table (0 disables)
+    analyst_stats_reconcile_seconds: float = 300.0
+    # "postgres" | "memory"; None picks by database dialect
+    event_bus: Optional[str] = None
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        # Load backend/.env
+        load_dotenv()
+        return cls(
+            database_url=os.getenv("DATABASE_URL"),
+            replica_urls=_csv(os.getenv("DATABASE_REPLICA_URLS")),
+            replica_healthcheck_seconds=float(os.getenv("REPLICA_HEALTHCHECK_SECONDS", "10")),
+            replica_connect_timeout_seconds=int(os.getenv("REPLICA_CONNECT_TIMEOUT_SECONDS", "2")),
+            read_your_writes_seconds=float(os.getenv("READ_YOUR_WRITES_SECONDS", "5")),
+            analyst_stats_reconcile_seconds=float(os.getenv("ANALYST_STATS_RECONCILE_SECONDS", "300")),
+            event_bus=os.getenv("EVENT_BUS") or None,
+        )
+
+    def require_database_url(self) -> str:
+        if not self.database_url:
+            raise RuntimeError("DATABASE_URL not set. Create backend/.env and set DATABASE_URL.")
+        return self.database_url
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Process-wide settings, read from the environment (and backend/.env) on first use."""
+    return Settings.from_env()
@@ -0,0 +1,120 @@
+"""
+Cold-start benchmark for the API.
+
+Reports per-module import time for `app.main` (via `python -X importtime`)
+and wall-clock time from spawning uvicorn to the first successful /health
+response. Run from backend/:
+
+    python benchmarks/startup.py [--top 25] [--runs 3]
+
+Uses DATABASE_URL if set, otherwise a throwaway SQLite file (startup must
+not need a reachable database).
+"""
+import argparse
+import os
+import re
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_IMPORTTIME = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def _env():
+    env = dict(os.environ)
+    if not env.get("DATABASE_URL"):
+        env["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.gettempdir(), "gp_startup_bench.db")
+    # Background reconciliation would otherwise hit the DB during the measurement
+    env.setdefault("ANALYST_STATS_RECONCILE_SECONDS", "0")
+    return env
+
+
+def import_times():
+    """[(cumulative_us, self_us, depth, module)] for a fresh `import app.main`."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        cwd=BACKEND_DIR,
+        env=_env(),
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise SystemExit(f"import app.main failed:\n{proc.stderr[-2000:]}")
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        m = _IMPORTTIME.match(line)
+        if m:
+            self_us, cum_us, indent, module = m.groups()
+            rows.append((int(cum_us), int(self_us), len(indent) // 2, module))
+    return rows
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def time_to_first_request(timeout: float = 30.0) -> float:
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}/health"
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR,
+        env=_env(),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            if proc.poll() is not None:
+                raise SystemExit(f"uvicorn exited early:\n{proc.stderr.read().decode()[-2000:]}")
+            try:
+                with urllib.request.urlopen(url, timeout=0.5) as resp:
+                    if resp.status == 200:
+                        return time.perf_counter() - started
+            except OSError:
+                time.sleep(0.01)
+        raise SystemExit(f"no response from {url} within {timeout}s")
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--top", type=int, default=25, help="slowest modules to list")
+    parser.add_argument("--runs", type=int, default=3, help="uvicorn cold starts to time")
+    args = parser.parse_args()
+
+    rows = import_times()
+    app_main = next((cum for cum, _, _, mod in rows if mod == "app.main"), 0)
+    print(f"import app.main: {app_main / 1000:.1f} ms")
+
+    print(f"\nslowest {args.top} modules by cumulative import time:")
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for cum, self_us, _, module in sorted(rows, reverse=True)[: args.top]:
+        print(f"{cum / 1000:>14.1f} {self_us / 1000:>9.1f}  {module}")
+
+    print("\napp.* modules:")
+    for cum, self_us, _, module in sorted(r for r in rows if r[3].startswith("app"))[::-1]:
+        print(f"{cum / 1000:>14.1f} {self_us / 1000:>9.1f}  {module}")
+
+    samples = [time_to_first_request() for _ in range(args.runs)]
+    print(
+        f"\ntime to first request over {args.runs} run(s): "
+        f"median {statistics.median(samples) * 1000:.0f} ms, "
+        f"min {min(samples) * 1000:.0f} ms, max {max(samples) * 1000:.0f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Write-path benchmark: the single unit-of-work commit used by the crud layer
+versus the previous commit -> refresh -> add_audit(commit -> refresh) path.
+
+Times note creation (entity + audit row) both ways and reports latency
+percentiles, writes/sec, and SQL statements / commits per write. Run from
+backend/:
+
+    python benchmarks/writes.py [--n 500]
+
+Uses DATABASE_URL if set (schema must be migrated), otherwise a throwaway
+SQLite file with the tables created on the fly.
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+if not os.getenv("DATABASE_URL"):
+    _path = os.path.join(tempfile.gettempdir(), "gp_write_bench.db")
+    if os.path.exists(_path):
+        os.remove(_path)
+    os.environ["DATABASE_URL"] = "sqlite:///" + _path
+    _CREATE_SCHEMA = True
+else:
+    _CREATE_SCHEMA = False
+
+from sqlalchemy import event  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.db import Base, SessionLocal, get_engine  # noqa: E402
+from app.models import AuditLog, Note, Transaction  # noqa: E402
+from app.schemas.note import NoteUpsert  # noqa: E402
+from app.crud.notes import upsert_note  # noqa: E402
+
+
+class Counter:
+    def __init__(self, engine):
+        self.statements = 0
+        self.commits = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+        event.listen(engine, "commit", self._on_commit)
+
+    def _on_execute(self, *args):
+        self.statements += 1
+
+    def _on_commit(self, *args):
+        self.commits += 1
+
+    def reset(self):
+        self.statements = 0
+        self.commits = 0
+
+
+def legacy_upsert_note(db, payload: NoteUpsert):
+    # The pre-unit-of-work path: two transactions and two refresh SELECTs per write
+    obj = Note(**payload.model_dump())
+    db.add(obj)
+    db.commit()
+    db.refresh(obj)
+    audit = AuditLog(action="note.create", meta={"tx_id": obj.tx_id, "note_id": obj.id})
+    db.add(audit)
+    db.commit()
+    db.refresh(audit)
+    return obj
+
+
+def run(label, make_session, write, tx_id, n, counter):
+    latencies = []
+    counter.reset()
+    started = time.perf_counter()
+    for i in range(n):
+        db = make_session()
+        try:
+            t0 = time.perf_counter()
+            write(db, NoteUpsert(tx_id=tx_id, body=f"{label} benchmark note {i}", author="bench"))
+            latencies.append(time.perf_counter() - t0)
+        finally:
+            db.close()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    p = lambda q: latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000  # noqa: E731
+    print(
+        f"{label:<16} mean {statistics.mean(latencies) * 1000:7.2f} ms  p50 {p(0.5):7.2f} ms  "
+        f"p95 {p(0.95):7.2f} ms  {n / elapsed:8.0f} writes/s  "
+        f"{counter.statements / n:4.1f} stmts/write  {counter.commits / n:3.1f} commits/write"
+    )
+    return n / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--n", type=int, default=500, help="writes per path")
+    args = parser.parse_args()
+
+    engine = get_engine()
+    if _CREATE_SCHEMA:
+        Base.metadata.create_all(engine)
+    legacy_session = sessionmaker(bind=engine, autoflush=False)
+
+    tx_id = f"BENCH-{uuid.uuid4().hex[:12]}"
+    with SessionLocal() as db:
+        db.add(Transaction(tx_id=tx_id, user="bench", amount=1.0, ts=datetime.now(timezone.utc)))
+        db.commit()
+
+    counter = Counter(engine)
+    print(f"{engine.dialect.name}, {args.n} note writes per path\n")
+    # Warm both paths (pool, statement cache) before timing
+    run("warmup", legacy_session, legacy_upsert_note, tx_id, min(50, args.n), counter)
+    run("warmup", SessionLocal, upsert_note, tx_id, min(50, args.n), counter)
+    print()
+    legacy = run("commit+refresh", legacy_session, legacy_upsert_note, tx_id, args.n, counter)
+    uow = run("unit of work", SessionLocal, upsert_note, tx_id, args.n, counter)
+    print(f"\nunit of work throughput: {uow / legacy:.2f}x the commit+refresh path")
+
+
+if __name__ == "__main__":
+    main()
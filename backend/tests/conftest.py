@@ -0,0 +1,39 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+# Throwaway SQLite DB for the whole session; must be set before app.settings is first read
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.mkdtemp(prefix="gp-tests-"), "test.db")
+os.environ["EVENT_BUS"] = "memory"
+os.environ["ANALYST_STATS_RECONCILE_SECONDS"] = "0"
+
+from datetime import datetime, timezone  # noqa: E402
+
+from app.db import Base, SessionLocal, get_engine  # noqa: E402
+import app.models  # noqa: E402,F401
+from app.crud.transactions import create_transaction  # noqa: E402
+from app.schemas.transaction import TransactionCreate  # noqa: E402
+
+
+@pytest.fixture
+def db():
+    engine = get_engine()
+    Base.metadata.create_all(engine)
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(engine)
+
+
+@pytest.fixture
+def tx(db):
+    return create_transaction(
+        db, TransactionCreate(tx_id="TX-1", user="alice", amount=10.0, ts=datetime.now(timezone.utc))
+    )
@@ -0,0 +1,61 @@
+from datetime import datetime, timedelta, timezone
+
+from app.crud.analyst_stats import UNASSIGNED, get_analyst_stats, reconcile_analyst_stats
+from app.crud.cases import create_case, update_case, claim_next_case
+from app.schemas.cases import CaseCreate, CaseUpdate
+
+
+def test_incremental_counters_match_reconcile(db, tx):
+    now = datetime.now(timezone.utc)
+    a = create_case(db, CaseCreate(tx_id=tx.tx_id, severity="RED", sla_due_at=now - timedelta(minutes=5)))
+    b = create_case(db, CaseCreate(tx_id=tx.tx_id, severity="ORANGE", sla_due_at=now + timedelta(minutes=20)))
+    create_case(db, CaseCreate(tx_id=tx.tx_id, severity="GREEN"))
+    create_case(db, CaseCreate(tx_id=tx.tx_id, assigned_to="bob"))
+
+    claim_next_case(db, "alice")
+    claim_next_case(db, "alice")
+    update_case(db, b.id, CaseUpdate(status="ESCALATED"))
+    update_case(db, a.id, CaseUpdate(status="CLOSED"))
+    update_case(db, b.id, CaseUpdate(assigned_to="bob"))
+
+    incremental = get_analyst_stats(db, now=now)
+    reconcile_analyst_stats(db)
+    rebuilt = get_analyst_stats(db, now=now)
+
+    assert incremental == rebuilt
+    by_analyst = {r["analyst"]: r for r in rebuilt}
+    assert set(by_analyst) == {"alice", "bob"}
+    assert by_analyst["alice"]["closed"] == 1
+    assert by_analyst["bob"]["open"] == 2
+    assert by_analyst["bob"]["escalated"] == 1
+
+
+def test_overdue_only_once_sla_has_passed(db, tx):
+    now = datetime.now(timezone.utc).replace(second=30, microsecond=0)
+    create_case(db, CaseCreate(tx_id=tx.tx_id, assigned_to="carol", sla_due_at=now + timedelta(seconds=20)))
+    create_case(db, CaseCreate(tx_id=tx.tx_id, assigned_to="carol", sla_due_at=now - timedelta(minutes=2)))
+
+    (row,) = get_analyst_stats(db, analyst="carol", now=now)
+    assert row["overdue"] == 1
+    assert row["due_soon"] == 2
+
+
+def test_unassigned_work_and_emptied_analysts_are_not_listed(db, tx):
+    obj = create_case(db, CaseCreate(tx_id=tx.tx_id, assigned_to="dave"))
+    create_case(db, CaseCreate(tx_id=tx.tx_id))
+    update_case(db, obj.id, CaseUpdate(assigned_to="erin"))
+
+    rows = get_analyst_stats(db)
+
+    assert [r["analyst"] for r in rows] == ["erin"]
+    assert get_analyst_stats(db, analyst=UNASSIGNED) == []
+    assert get_analyst_stats(db, analyst="dave") == []
+
+
+def test_avg_sla_goes_negative_when_past_due(db, tx):
+    now = datetime.now(timezone.utc)
+    create_case(db, CaseCreate(tx_id=tx.tx_id, assigned_to="frank", sla_due_at=now - timedelta(minutes=50)))
+    create_case(db, CaseCreate(tx_id=tx.tx_id, assigned_to="frank", sla_due_at=now + timedelta(minutes=10)))
+
+    (row,) = get_analyst_stats(db, analyst="frank", now=now)
+    assert row["avg_sla_minutes"] == -20
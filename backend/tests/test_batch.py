@@ -0,0 +1,38 @@
+import pytest
+
+from app.crud.batch import run_batch, BatchQueryError
+from app.crud.cases import create_case
+from app.crud.notes import upsert_note
+from app.schemas.batch import BatchQuery, BatchRequest
+from app.schemas.cases import CaseCreate
+from app.schemas.note import NoteUpsert
+
+
+def test_filters_are_coerced_to_column_types(db, tx):
+    case = create_case(db, CaseCreate(tx_id=tx.tx_id))
+    upsert_note(db, NoteUpsert(tx_id=tx.tx_id, body="linked", case_id=case.id))
+    upsert_note(db, NoteUpsert(tx_id=tx.tx_id, body="loose"))
+
+    results = run_batch(
+        db,
+        [
+            BatchQuery(resource="notes", key="linked", filters={"case_id": str(case.id)}),
+            BatchQuery(resource="notes", key="loose", filters={"case_id": None}),
+            BatchQuery(resource="notes", key="either", filters={"case_id": [case.id, None]}),
+        ],
+    )
+
+    assert [n.body for n in results["linked"]] == ["linked"]
+    assert [n.body for n in results["loose"]] == ["loose"]
+    assert len(results["either"]) == 2
+
+
+@pytest.mark.parametrize("value", ["abc", 1.5, True, ["1", "x"]])
+def test_uncoercible_filter_value_is_a_client_error(db, value):
+    with pytest.raises(BatchQueryError):
+        run_batch(db, [BatchQuery(resource="notes", filters={"case_id": value})])
+
+
+def test_nested_filter_values_fail_validation():
+    with pytest.raises(ValueError):
+        BatchRequest(queries=[{"resource": "notes", "filters": {"tx_id": {"a": 1}}}])
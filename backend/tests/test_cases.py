@@ -0,0 +1,55 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.db import SessionLocal
+from app.crud.cases import create_case, update_case, claim_next_case, CaseVersionConflict
+from app.schemas.cases import CaseCreate, CaseUpdate
+
+
+def test_claim_orders_by_severity_then_sla(db, tx):
+    now = datetime.now(timezone.utc)
+    green = create_case(db, CaseCreate(tx_id=tx.tx_id, severity="GREEN", sla_due_at=now))
+    red_late = create_case(db, CaseCreate(tx_id=tx.tx_id, severity="RED", sla_due_at=now + timedelta(hours=1)))
+    red_soon = create_case(db, CaseCreate(tx_id=tx.tx_id, severity="RED", sla_due_at=now + timedelta(minutes=5)))
+    create_case(db, CaseCreate(tx_id=tx.tx_id, severity="RED", assigned_to="already-taken"))
+
+    claimed = [claim_next_case(db, "alice").id for _ in range(3)]
+
+    assert claimed == [red_soon.id, red_late.id, green.id]
+    assert claim_next_case(db, "alice") is None
+
+
+def test_claimed_case_is_assigned_and_in_review(db, tx):
+    create_case(db, CaseCreate(tx_id=tx.tx_id))
+    obj = claim_next_case(db, "bob")
+    assert (obj.assigned_to, obj.status, obj.version) == ("bob", "IN_REVIEW", 2)
+
+
+def test_update_with_stale_version_is_rejected(db, tx):
+    obj = create_case(db, CaseCreate(tx_id=tx.tx_id))
+    update_case(db, obj.id, CaseUpdate(status="IN_REVIEW", version=1))
+
+    with pytest.raises(CaseVersionConflict):
+        update_case(db, obj.id, CaseUpdate(status="CLOSED", version=1))
+
+
+def test_concurrent_update_raises_conflict(db, tx):
+    obj = create_case(db, CaseCreate(tx_id=tx.tx_id))
+    other = SessionLocal()
+    try:
+        stale = other.get(type(obj), obj.id)  # held so the identity map keeps version 1
+        update_case(db, obj.id, CaseUpdate(status="ESCALATED"))
+
+        with pytest.raises(CaseVersionConflict):
+            update_case(other, stale.id, CaseUpdate(status="CLOSED"))
+    finally:
+        other.close()
+
+
+def test_severity_rank_is_generated_and_unknown_severity_sorts_last(db, tx):
+    odd = create_case(db, CaseCreate(tx_id=tx.tx_id, severity="PURPLE", sla_due_at=datetime.now(timezone.utc)))
+    red = create_case(db, CaseCreate(tx_id=tx.tx_id, severity="RED"))
+
+    assert (red.severity_rank, odd.severity_rank) == (0, 3)
+    assert [claim_next_case(db, "alice").id for _ in range(2)] == [red.id, odd.id]
@@ -0,0 +1,99 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine
+
+from app.events import bus as bus_module
+from app.events import InMemoryBus, PostgresBus, publish
+
+
+@pytest.fixture
+def bus(monkeypatch):
+    fresh = InMemoryBus()
+    monkeypatch.setattr(bus_module, "_bus", fresh)
+    return fresh
+
+
+def _recorder(bus, topic):
+    seen = []
+    bus.subscribe(topic, lambda t, payload, local: seen.append((t, payload, local)))
+    return seen
+
+
+def test_events_arrive_only_after_commit(db, bus):
+    seen = _recorder(bus, "*")
+
+    publish(db, "case.updated", {"id": 1})
+    assert seen == []
+
+    db.commit()
+    assert seen == [("case.updated", {"id": 1}, True)]
+
+
+def test_rollback_drops_pending_events(db, bus):
+    seen = _recorder(bus, "*")
+
+    publish(db, "note.created", {"id": 1})
+    db.rollback()
+    db.commit()
+
+    assert seen == []
+
+
+def test_topic_matching(db, bus):
+    exact = _recorder(bus, "note.created")
+    prefix = _recorder(bus, "case.")
+    everything = _recorder(bus, "*")
+
+    for topic in ("note.created", "note.deleted", "case.created", "case.updated", "casework"):
+        publish(db, topic)
+    db.commit()
+
+    assert [t for t, _, _ in exact] == ["note.created"]
+    assert [t for t, _, _ in prefix] == ["case.created", "case.updated"]
+    assert len(everything) == 5
+
+
+def test_failing_handler_does_not_stop_the_others(db, bus):
+    bus.subscribe("*", lambda *args: 1 / 0)
+    seen = _recorder(bus, "*")
+
+    publish(db, "audit.created")
+    db.commit()
+
+    assert len(seen) == 1
+
+
+class _RecordingSession:
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, stmt):
+        self.statements.append(stmt.compile())
+
+
+def test_postgres_bus_sends_one_statement_per_commit():
+    pg = PostgresBus(create_engine("postgresql+psycopg2://localhost/unused"))
+    events = [
+        {"topic": "note.created", "payload": {"id": i, "body": "x" * 500}, "origin": pg.origin} for i in range(40)
+    ]
+    session = _RecordingSession()
+
+    pg._before_commit(session, events)
+    assert session.statements == []  # nobody subscribed, nothing to send
+
+    pg.subscribe("*", lambda *args: None)
+    pg._before_commit(session, events)
+
+    (stmt,) = session.statements
+    payloads = [v for v in stmt.params.values() if v != PostgresBus.CHANNEL]
+    assert len(payloads) > 1  # 40 large events do not fit one NOTIFY payload
+    assert all(len(p) <= PostgresBus.MAX_PAYLOAD for p in payloads)
+    assert [e["payload"]["id"] for p in payloads for e in json.loads(p)] == list(range(40))
+
+
+def test_postgres_bus_refuses_drivers_it_cannot_listen_with():
+    pg = PostgresBus(SimpleNamespace(dialect=SimpleNamespace(name="postgresql", driver="asyncpg")))
+    with pytest.raises(RuntimeError, match="asyncpg"):
+        pg.start()
@@ -0,0 +1,40 @@
+import asyncio
+import dataclasses
+import threading
+
+from app import main
+
+
+def test_shutdown_awaits_reconcile_task_and_stops_bus_off_loop(monkeypatch):
+    stopped_on = []
+    reconcile_cancelled = []
+
+    class Bus:
+        def start(self):
+            pass
+
+        def stop(self):
+            stopped_on.append(threading.current_thread())
+
+    async def reconcile_forever(interval):
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            reconcile_cancelled.append(True)
+            raise
+
+    monkeypatch.setattr(main, "get_bus", lambda: Bus())
+    monkeypatch.setattr(main, "_reconcile_stats_forever", reconcile_forever)
+    settings = dataclasses.replace(main.get_settings(), analyst_stats_reconcile_seconds=60)
+    monkeypatch.setattr(main, "get_settings", lambda: settings)
+
+    async def run():
+        async with main.lifespan(main.app):
+            await asyncio.sleep(0)
+        # Shutdown has already waited for the task to finish cancelling
+        assert reconcile_cancelled == [True]
+        return threading.current_thread()
+
+    loop_thread = asyncio.run(run())
+
+    assert stopped_on and stopped_on[0] is not loop_thread
@@ -0,0 +1,100 @@
+import os
+import tempfile
+import time
+from types import SimpleNamespace
+
+import pytest
+from starlette.requests import Request
+
+from sqlalchemy import event
+
+from app.db import get_engine, routing
+from app.db.routing import ReplicaSet
+from app.routes import deps
+from app.routes.deps import LAST_WRITE_HEADER, _wrote_recently, get_read_db
+
+
+def _request(stamp=None):
+    headers = [(LAST_WRITE_HEADER.lower().encode(), str(stamp).encode())] if stamp is not None else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+def test_recent_write_stamp_sticks_reads_to_primary():
+    assert _wrote_recently(_request(time.time() - 1))
+
+
+def test_old_missing_or_garbled_stamp_allows_replica():
+    assert not _wrote_recently(_request(time.time() - 60))
+    assert not _wrote_recently(_request())
+    assert not _wrote_recently(_request("not-a-number"))
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(routing, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+@pytest.fixture
+def replicas(clock):
+    tmp = tempfile.mkdtemp(prefix="gp-replicas-")
+    rs = ReplicaSet([f"sqlite:///{os.path.join(tmp, f'r{i}.db')}" for i in range(2)], check_interval=10)
+    rs.up = {id(e): True for e in rs.engines}
+    rs._probe = lambda eng: rs.up[id(eng)]
+    return rs
+
+
+def test_pick_round_robins_and_skips_a_replica_marked_down(replicas):
+    r0, r1 = replicas.engines
+    assert [replicas.pick() for _ in range(4)] == [r0, r1, r0, r1]
+
+    replicas.up[id(r0)] = False
+    replicas.mark_down(r0)
+
+    assert [replicas.pick() for _ in range(3)] == [r1, r1, r1]
+
+
+def test_reads_fall_back_to_primary_when_every_replica_is_down(replicas, monkeypatch):
+    primary = get_engine()
+    for eng in replicas.engines:
+        replicas.mark_down(eng)
+    monkeypatch.setattr(deps, "get_replicas", lambda: replicas)
+
+    assert replicas.pick() is None
+    dep = get_read_db(_request())
+    db = next(dep)
+    try:
+        assert db.get_bind() is primary
+    finally:
+        dep.close()
+
+
+def test_replica_returns_after_check_interval_once_probe_succeeds(replicas, clock):
+    r0, r1 = replicas.engines
+    replicas.up[id(r0)] = False
+    replicas.mark_down(r0)
+
+    clock[0] += 11
+    assert [replicas.pick() for _ in range(2)] == [r1, r1]  # re-probed, still failing
+
+    replicas.up[id(r0)] = True
+    clock[0] += 5
+    assert replicas.pick() is r1  # not due for another probe yet
+
+    clock[0] += 6
+    assert {replicas.pick() for _ in range(2)} == {r0, r1}
+
+
+def test_postgres_replicas_connect_with_a_timeout():
+    rs = ReplicaSet(["postgresql+psycopg2://replica/db"], check_interval=0, connect_timeout=3)
+    (eng,) = rs.engines
+    seen = {}
+
+    @event.listens_for(eng, "do_connect")
+    def refuse(dialect, conn_rec, cargs, cparams):
+        seen.update(cparams)
+        raise OSError("unreachable")
+
+    assert rs.pick() is None
+    assert seen["connect_timeout"] == 3
@@ -0,0 +1,31 @@
+import pytest
+
+from app.crud import search as search_crud
+from app.crud.notes import upsert_note
+from app.schemas.note import NoteUpsert
+from app.search import InvertedIndex
+
+
+@pytest.fixture(autouse=True)
+def fresh_index(monkeypatch):
+    # The process-wide index would otherwise carry rows from earlier tests' databases
+    monkeypatch.setattr(search_crud, "search_index", InvertedIndex())
+
+
+def test_note_written_after_first_search_is_found(db, tx):
+    upsert_note(db, NoteUpsert(tx_id=tx.tx_id, body="customer confirmed the card was stolen"))
+    assert search_crud.search(db, "stolen")["total"] == 1
+
+    note = upsert_note(db, NoteUpsert(tx_id=tx.tx_id, body="second report: card stolen abroad"))
+    result = search_crud.search(db, "stolen abroad")
+
+    assert result["total"] == 1
+    assert result["items"][0]["id"] == note.id
+    assert result["items"][0]["kind"] == "note"
+
+
+def test_page_past_the_end_keeps_total(db, tx):
+    for i in range(3):
+        upsert_note(db, NoteUpsert(tx_id=tx.tx_id, body=f"chargeback {i}"))
+
+    assert search_crud.search(db, "chargeback", limit=2, offset=10) == {"total": 3, "items": []}
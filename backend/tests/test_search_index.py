@@ -0,0 +1,66 @@
+from app.search.index import InvertedIndex, tokenize
+
+
+def _built(*docs):
+    index = InvertedIndex()
+    index.rebuild(docs)
+    return index
+
+
+def test_tokenize_lowercases_and_splits_on_punctuation():
+    assert tokenize("Card-testing, CARD 42!") == ["card", "testing", "card", "42"]
+    assert tokenize(None) == []
+
+
+def test_search_requires_every_term_and_ranks_by_tf_idf():
+    index = _built(
+        ("note", 1, "body", "TX-1", "card testing card card"),
+        ("note", 2, "body", "TX-2", "card testing"),
+        ("note", 3, "body", "TX-3", "card only"),
+    )
+
+    total, hits = index.search("card testing")
+
+    assert total == 2
+    assert [h["id"] for h in hits] == [1, 2]
+    assert hits[0]["tx_id"] == "TX-1"
+    assert index.search("testing missing") == (0, [])
+    assert index.search("   ") == (0, [])
+
+
+def test_pagination():
+    index = _built(*[("note", i, "body", f"TX-{i}", "velocity spike") for i in range(1, 6)])
+
+    total, page = index.search("velocity", limit=2, offset=2)
+
+    assert total == 5
+    assert [h["id"] for h in page] == [3, 2]  # equal scores: newest id first
+
+
+def test_add_replaces_previous_text_for_same_doc():
+    index = _built(("transaction", 1, "merchant", "TX-1", "Acme"))
+    index.add("transaction", 1, "merchant", "TX-1", "Globex")
+
+    assert index.search("acme") == (0, [])
+    assert index.search("globex")[0] == 1
+
+
+def test_add_is_ignored_until_built():
+    index = InvertedIndex()
+    index.add("note", 1, "body", "TX-1", "hello")
+    index.rebuild([])
+
+    assert index.search("hello") == (0, [])
+
+
+def test_writes_during_rebuild_are_kept():
+    index = InvertedIndex()
+
+    def docs():
+        yield ("note", 1, "body", "TX-1", "snapshot row")
+        # Committed after the rebuild's scan started, so missing from the snapshot
+        index.add("note", 2, "body", "TX-2", "late row")
+
+    index.rebuild(docs())
+    assert index.search("row")[0] == 2
+
@@ -0,0 +1,58 @@
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event, func, select
+
+from app.crud.notes import upsert_note
+from app.db import get_engine
+from app.models import AuditLog, Note
+from app.schemas.note import NoteUpsert
+
+
+@contextmanager
+def _listening(name, fn):
+    engine = get_engine()
+    event.listen(engine, name, fn)
+    try:
+        yield
+    finally:
+        event.remove(engine, name, fn)
+
+
+def _fail_audit_insert(conn, cursor, statement, parameters, context, executemany):
+    # The note INSERT has already run in this transaction by the time this fires
+    if statement.startswith("INSERT INTO audit_logs"):
+        raise RuntimeError("audit insert failed")
+
+
+def _fail_commit(conn):
+    raise RuntimeError("commit failed")
+
+
+def _counts(db):
+    return db.scalar(select(func.count()).select_from(Note)), db.scalar(select(func.count()).select_from(AuditLog))
+
+
+def test_entity_and_audit_row_land_in_one_commit(db, tx):
+    notes_before, audit_before = _counts(db)
+    commits = []
+
+    with _listening("commit", commits.append):
+        note = upsert_note(db, NoteUpsert(tx_id=tx.tx_id, body="called the cardholder"))
+
+    assert len(commits) == 1
+    assert _counts(db) == (notes_before + 1, audit_before + 1)
+    audit = db.execute(select(AuditLog).order_by(AuditLog.id.desc())).scalars().first()
+    assert (audit.action, audit.meta["note_id"]) == ("note.create", note.id)
+
+
+@pytest.mark.parametrize(
+    "hook, fn", [("before_cursor_execute", _fail_audit_insert), ("commit", _fail_commit)], ids=["flush", "commit"]
+)
+def test_failed_write_leaves_neither_row(db, tx, hook, fn):
+    before = _counts(db)
+
+    with _listening(hook, fn), pytest.raises(RuntimeError):
+        upsert_note(db, NoteUpsert(tx_id=tx.tx_id, body="never stored"))
+
+    assert _counts(db) == before
@@ -1,6 +1,8 @@
 // src/services/api.js
 // Real API client for FastAPI backend (http://127.0.0.1:8000)
 
+import { withWriteStamp, rememberWriteStamp } from "./writeStamp";
+
 const BASE_URL =
   import.meta.env.VITE_API_URL?.replace(/\/$/, "") || "http://127.0.0.1:8000";
 
@@ -9,12 +11,13 @@ async function request(path, { method = "GET", body, headers } = {}) {
 
   const res = await fetch(url, {
     method,
-    headers: {
+    headers: withWriteStamp({
       "Content-Type": "application/json",
       ...(headers || {}),
-    },
+    }),
     body: body ? JSON.stringify(body) : undefined,
   });
+  rememberWriteStamp(res);
 
   // Handle non-JSON errors safely
   const text = await res.text();
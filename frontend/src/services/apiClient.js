@@ -3,6 +3,7 @@
 // Supports MOCK mode while keeping a fixed API contract.
 
 import { mockDb } from "./mockDb";
+import { withWriteStamp, rememberWriteStamp } from "./writeStamp";
 
 const API_BASE = import.meta.env.VITE_API_BASE || "http://127.0.0.1:8000";
 const USE_MOCKS =
@@ -12,9 +13,10 @@ const sleep = (ms) => new Promise((r) => setTimeout(r, ms));
 
 async function request(path, options = {}) {
   const res = await fetch(`${API_BASE}${path}`, {
-    headers: { "Content-Type": "application/json", ...(options.headers || {}) },
     ...options,
+    headers: withWriteStamp({ "Content-Type": "application/json", ...(options.headers || {}) }),
   });
+  rememberWriteStamp(res);
 
   if (!res.ok) {
     const text = await res.text().catch(() => "");
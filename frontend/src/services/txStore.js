@@ -1,11 +1,14 @@
 // frontend/src/services/txStore.js
+import { withWriteStamp, rememberWriteStamp } from "./writeStamp";
+
 const API_BASE = import.meta.env.VITE_API_BASE || "http://127.0.0.1:8000";
 
 async function jsonFetch(path, options = {}) {
   const res = await fetch(`${API_BASE}${path}`, {
-    headers: { "Content-Type": "application/json", ...(options.headers || {}) },
     ...options,
+    headers: withWriteStamp({ "Content-Type": "application/json", ...(options.headers || {}) }),
   });
+  rememberWriteStamp(res);
 
   if (!res.ok) {
     const text = await res.text().catch(() => "");
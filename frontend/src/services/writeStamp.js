@@ -0,0 +1,21 @@
+// src/services/writeStamp.js
+// Read-your-writes support for the backend's read replicas.
+// After a successful write the API returns an X-Last-Write-At stamp; echoing it
+// on later requests keeps this client's reads on the primary for a few seconds,
+// so a GET right after a PATCH never sees a lagging replica.
+
+const HEADER = "X-Last-Write-At";
+const STORAGE_KEY = "gp_last_write_at";
+
+let lastWriteAt = sessionStorage.getItem(STORAGE_KEY);
+
+export function withWriteStamp(headers = {}) {
+  return lastWriteAt ? { ...headers, [HEADER]: lastWriteAt } : headers;
+}
+
+export function rememberWriteStamp(res) {
+  const stamp = res.headers.get(HEADER);
+  if (!stamp) return;
+  lastWriteAt = stamp;
+  sessionStorage.setItem(STORAGE_KEY, stamp);
+}